@@ -1,5 +1,15 @@
 from typing import Iterator
 from datetime import datetime
+from collections import Counter
+import asyncio
+import bisect
+import csv
+import heapq
+import io
+import itertools
+import mmap
+import sys
+import threading
 
 
 
@@ -88,6 +98,290 @@ class SeniorExecutive:
         self.interests = interests
 
 
+#______________________________________________________________________________________
+
+"""
+    Represents an on-disk catalog of Senior Executives that is loaded lazily.
+
+    The catalog is a CSV file (see write()) that is memory-mapped when opened, so opening it
+    costs the same regardless of its size. SeniorExecutive objects are only created the first
+    time they are accessed and are then cached. The line offset index and the industry index
+    are built in a background thread; until they are ready, iteration streams the file and
+    industry lookups fall back to a scan.
+
+    The catalog behaves like the list it replaces in Platform.senior_executives: it supports
+    iteration, len(), indexing, `in`, append(), remove() and full slice assignment.
+
+    Attributes:
+    - path: Path of the catalog file.
+    - cache: Dictionary mapping a line offset to its materialized SeniorExecutive.
+    - removed: Set of line offsets whose Senior Executive has been removed.
+    - removed_sorted: The removed line offsets in file order, used for positional indexing.
+    - appended: List of Senior Executives added after the catalog was opened.
+    - offsets: List of line offsets, available once the index is built.
+    - industry_index: Dictionary mapping a lowercased industry to line offsets, available once the index is built.
+    - indexed: threading.Event set once the background indexer has finished.
+    - index_error: Exception that stopped the background indexer, re-raised to callers that need the index.
+"""
+
+class SeniorExecutiveCatalog:
+    FIELDS = ["name", "industry", "company", "title", "price", "region", "interests"]
+    INTEREST_SEPARATOR = ";"
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, "rb")
+        if self.file.seek(0, io.SEEK_END) > 0:
+            self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self.data = b""
+        header_end = self.data.find(b"\n")
+        self.start = len(self.data) if header_end < 0 else header_end + 1
+        self.cache = {}
+        self.positions = {}
+        self.removed = set()
+        self.removed_sorted = []
+        self.appended = []
+        self.offsets = None
+        self.industry_index = None
+        self.indexed = threading.Event()
+        self.index_error = None
+        self.closing = False
+        self.indexer = threading.Thread(target=self.build_indexes, daemon=True)
+        self.indexer.start()
+
+    # Writes Senior Executives to a catalog file that can be opened with SeniorExecutiveCatalog.
+    # Every record must fit on one line, so fields containing line breaks are rejected, as are
+    # interests containing the interest separator.
+    @staticmethod
+    def write(path, executives):
+        with open(path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file, lineterminator="\n")
+            writer.writerow(SeniorExecutiveCatalog.FIELDS)
+            for executive in executives:
+                interests = executive.get_interests()
+                row = [
+                    executive.get_name(), executive.get_industry(), executive.get_company(),
+                    executive.get_title(), executive.get_price(), executive.get_region(),
+                    SeniorExecutiveCatalog.INTEREST_SEPARATOR.join(interests),
+                ]
+                if any("\n" in str(field) or "\r" in str(field) for field in row):
+                    raise ValueError(f"Catalog fields cannot contain line breaks: {executive.get_name()!r}")
+                if any(SeniorExecutiveCatalog.INTEREST_SEPARATOR in interest for interest in interests):
+                    raise ValueError(f"Catalog interests cannot contain "
+                                     f"{SeniorExecutiveCatalog.INTEREST_SEPARATOR!r}: {executive.get_name()!r}")
+                writer.writerow(row)
+
+    # Parses a stored price back to the type it was written with (int or float).
+    @staticmethod
+    def parse_price(price):
+        try:
+            return int(price)
+        except ValueError:
+            return float(price)
+
+    # Parses one catalog line into its fields. Raises ValueError for malformed records.
+    @staticmethod
+    def parse(line):
+        fields = next(csv.reader([line.decode("utf-8")]), [])
+        if len(fields) != len(SeniorExecutiveCatalog.FIELDS):
+            raise ValueError(f"Malformed catalog record: {line[:80]!r}")
+        return fields
+
+    # Yields (offset, line) for every record in the file.
+    def scan(self):
+        position = self.start
+        end = len(self.data)
+        while position < end and not self.closing:
+            line_end = self.data.find(b"\n", position)
+            if line_end < 0:
+                line_end = end
+            if line_end > position:
+                yield position, self.data[position:line_end]
+            position = line_end + 1
+
+    # Builds the offset and industry indexes. Runs in the background thread. A failure is
+    # stored in index_error, and indexed is always set so callers never wait forever.
+    def build_indexes(self):
+        try:
+            offsets = []
+            industry_index = {}
+            for offset, line in self.scan():
+                offsets.append(offset)
+                industry = SeniorExecutiveCatalog.parse(line)[1].lower()
+                industry_index.setdefault(industry, []).append(offset)
+            self.offsets = offsets
+            self.industry_index = industry_index
+        except Exception as error:
+            self.index_error = error
+        finally:
+            self.indexed.set()
+
+    # Returns whether the indexes are ready, raising the indexer's error if it failed.
+    def index_ready(self):
+        if not self.indexed.is_set():
+            return False
+        if self.index_error is not None:
+            raise self.index_error
+        return True
+
+    # Returns the Senior Executive stored at an offset, creating it on first access.
+    def materialize(self, offset, line=None):
+        executive = self.cache.get(offset)
+        if executive is None:
+            if line is None:
+                line_end = self.data.find(b"\n", offset)
+                line = self.data[offset:line_end if line_end >= 0 else len(self.data)]
+            name, industry, company, title, price, region, interests = SeniorExecutiveCatalog.parse(line)
+            interests = interests.split(SeniorExecutiveCatalog.INTEREST_SEPARATOR) if interests else []
+            executive = SeniorExecutive(name, industry, company, title,
+                                        SeniorExecutiveCatalog.parse_price(price), region, interests)
+            self.cache[offset] = executive
+            self.positions[executive] = offset
+        return executive
+
+    # Yields (offset, line) for live records, using the index once it is ready.
+    def records(self):
+        if self.index_ready():
+            for offset in self.offsets:
+                if offset not in self.removed:
+                    yield offset, None
+        else:
+            for offset, line in self.scan():
+                if offset not in self.removed:
+                    yield offset, line
+
+    # Returns an iterator over all Senior Executives in the catalog.
+    def __iter__(self) -> Iterator[SeniorExecutive]:
+        for offset, line in self.records():
+            yield self.materialize(offset, line)
+        yield from list(self.appended)
+
+    # Returns the Senior Executives in an industry, using the industry index once it is ready.
+    def get_by_industry(self, industry):
+        key = industry.lower()
+        if not self.index_ready():
+            return [executive for executive in self if executive.get_industry().lower() == key]
+
+        indexed = self.industry_index.get(key, [])
+        executives = [executive for executive in
+                      (self.materialize(offset) for offset in indexed if offset not in self.removed)
+                      if executive.get_industry().lower() == key]
+        # Executives whose industry was updated after loading are not in the index bucket
+        candidates = set(indexed)
+        executives += [executive for offset, executive in self.cache.items()
+                       if offset not in candidates and offset not in self.removed
+                       and executive.get_industry().lower() == key]
+        executives += [executive for executive in self.appended if executive.get_industry().lower() == key]
+        return executives
+
+    # Waits until the background indexes are ready. Raises the indexer's error if it failed.
+    def wait_until_indexed(self, timeout=None):
+        self.indexed.wait(timeout)
+        return self.index_ready()
+
+    def __len__(self):
+        self.wait_until_indexed()
+        return len(self.offsets) - len(self.removed) + len(self.appended)
+
+    # Returns as soon as one live executive is found, without waiting for the index.
+    def __bool__(self):
+        if self.appended:
+            return True
+        for _ in self.records():
+            return True
+        return False
+
+    def __getitem__(self, index):
+        if not isinstance(index, int):
+            return list(self)[index]
+        if not self.index_ready():
+            if index >= 0:
+                executive = next(itertools.islice(iter(self), index, None), None)
+                if executive is None:
+                    raise IndexError("catalog index out of range")
+                return executive
+            return list(self)[index]
+
+        if index < 0:
+            index += len(self)
+        live = len(self.offsets) - len(self.removed)
+        if 0 <= index < live:
+            return self.materialize(self.offsets[self.position(index)])
+        if live <= index < live + len(self.appended):
+            return self.appended[index - live]
+        raise IndexError("catalog index out of range")
+
+    # Returns the position in self.offsets of the index-th live record. Skips the removed
+    # offsets in front of it using removed_sorted, in O(R log R) for R removals.
+    def position(self, index):
+        position = index
+        while True:
+            skipped = bisect.bisect_right(self.removed_sorted, self.offsets[position])
+            if index + skipped == position:
+                return position
+            position = index + skipped
+
+    # Replaces the whole catalog content, e.g. when a PlatformBatch commits.
+    def __setitem__(self, index, executives):
+        if index != slice(None):
+            raise TypeError("SeniorExecutiveCatalog only supports full slice assignment")
+        executives = list(executives)
+        self.wait_until_indexed()
+        self.removed.update(self.offsets)
+        self.removed_sorted = list(self.offsets)
+        self.appended = executives
+
+    def __contains__(self, executive):
+        offset = self.positions.get(executive)
+        if offset is not None and offset not in self.removed:
+            return True
+        return any(executive is appended for appended in self.appended)
+
+    # Adds a Senior Executive to the catalog (kept in memory).
+    def append(self, executive):
+        self.appended.append(executive)
+
+    # Removes a Senior Executive from the catalog.
+    def remove(self, executive):
+        offset = self.positions.get(executive)
+        if offset is not None and offset not in self.removed:
+            self.removed.add(offset)
+            bisect.insort(self.removed_sorted, offset)
+            return
+        for i, appended in enumerate(self.appended):
+            if appended is executive:
+                del self.appended[i]
+                return
+        raise ValueError("SeniorExecutiveCatalog.remove(x): x not in catalog")
+
+    # Appends and removes Senior Executives in one call, e.g. when a PlatformBatch commits.
+    def apply(self, additions, removals):
+        for executive in additions:
+            self.append(executive)
+        for executive in removals:
+            self.remove(executive)
+
+    # Returns the in-memory changes to the catalog, to be restored with restore().
+    def snapshot(self):
+        return set(self.removed), list(self.removed_sorted), list(self.appended)
+
+    # Restores the in-memory changes captured by snapshot().
+    def restore(self, state):
+        removed, removed_sorted, appended = state
+        self.removed = set(removed)
+        self.removed_sorted = list(removed_sorted)
+        self.appended = list(appended)
+
+    # Stops the background indexer and releases the mapped file.
+    def close(self):
+        self.closing = True
+        self.indexer.join()
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self.file.close()
+
+
 #______________________________________________________________________________________
 
 """
@@ -98,6 +392,7 @@ class SeniorExecutive:
     - industry: Industry the Aspiring Professional belongs to.
     - interests: Interests related to the Aspiring Professional's industry.
     - frequency: Number of times the Aspiring Professional has made bookings.
+    - frequency_listeners: Callables notified with the professional whenever the frequency changes.
 """
 
 class AspiringProfessional:
@@ -106,6 +401,7 @@ class AspiringProfessional:
         self.industry = industry
         self.interests = interests
         self.frequency = 0
+        self.frequency_listeners = []
 
     # Getter methods
     def get_name(self):
@@ -123,11 +419,45 @@ class AspiringProfessional:
     # Increases the booking frequency of the Aspiring Professional.
     def increase_frequency(self):
         self.frequency += 1
+        self.notify_frequency_listeners()
 
     # Decreases the booking frequency of the Aspiring Professional.
     def decrease_frequency(self):
         if self.frequency > 0:
             self.frequency -= 1
+            self.notify_frequency_listeners()
+
+    # Registers a callable to be notified when the frequency changes.
+    def add_frequency_listener(self, listener):
+        self.frequency_listeners.append(listener)
+
+    # Unregisters a previously registered frequency listener.
+    def remove_frequency_listener(self, listener):
+        if listener in self.frequency_listeners:
+            self.frequency_listeners.remove(listener)
+
+    # Changes the booking frequency by delta (never below zero) and notifies listeners once.
+    def adjust_frequency(self, delta):
+        frequency = max(0, self.frequency + delta)
+        if frequency != self.frequency:
+            self.frequency = frequency
+            self.notify_frequency_listeners()
+
+    # Notifies all frequency listeners of the current frequency.
+    # With suppress_errors, a failing listener does not stop the others from being notified.
+    def notify_frequency_listeners(self, suppress_errors=False):
+        for listener in list(self.frequency_listeners):
+            try:
+                listener(self)
+            except Exception:
+                if not suppress_errors:
+                    raise
+
+    # Restores a previous booking frequency and notifies every listener, ignoring listener errors.
+    def restore_frequency(self, frequency):
+        if frequency != self.frequency:
+            self.frequency = frequency
+            self.notify_frequency_listeners(suppress_errors=True)
 
 
     # Returns a formatted string with the Aspiring Professional's information
@@ -200,6 +530,20 @@ class EventLog:
     def log_event(self, event):
         self.events.append(event)
 
+    # Logs several events in the event log with a single write.
+    def log_events(self, events):
+        self.events.extend(events)
+
+    # Logs the event of a change record and publishes the record on the change feed.
+    def log_change(self, change):
+        self.log_event(change.get_event())
+        ChangeFeed().publish(change)
+
+    # Logs the events of several change records with a single write and publishes them in order.
+    def log_changes(self, changes):
+        self.log_events([change.get_event() for change in changes])
+        ChangeFeed().publish_many(changes)
+
     # Clears all events in the event log and logs a clearing event
     def clear(self):
         self.events.clear()
@@ -215,6 +559,383 @@ class EventLog:
 
 #______________________________________________________________________________________
 
+"""
+    Represents a typed change to the platform, published on the ChangeFeed.
+
+    Attributes:
+    - entity_type: Type of the changed entity (PROFESSIONAL, EXECUTIVE or BOOKING).
+    - action: What happened to the entity (ADDED, REMOVED or DAY_CHANGED), or OVERFLOW for the
+      record telling a subscriber that records were dropped (its entity_type and entity are None).
+    - entity: The changed AspiringProfessional, SeniorExecutive or Booking.
+    - event: The Event logged for the change.
+    - old_value: Previous value for DAY_CHANGED records, otherwise None.
+    - new_value: New value for DAY_CHANGED records, otherwise None.
+"""
+
+class ChangeRecord:
+    PROFESSIONAL = "Aspiring Professional"
+    EXECUTIVE = "Senior Executive"
+    BOOKING = "Booking"
+
+    ADDED = "added"
+    REMOVED = "removed"
+    DAY_CHANGED = "day changed"
+    OVERFLOW = "overflow"
+
+    def __init__(self, entity_type, action, entity, event, old_value=None, new_value=None):
+        self.entity_type = entity_type
+        self.action = action
+        self.entity = entity
+        self.event = event
+        self.old_value = old_value
+        self.new_value = new_value
+
+    # Getter methods
+    def get_entity_type(self):
+        return self.entity_type
+
+    def get_action(self):
+        return self.action
+
+    def get_entity(self):
+        return self.entity
+
+    def get_event(self):
+        return self.event
+
+    def get_old_value(self):
+        return self.old_value
+
+    def get_new_value(self):
+        return self.new_value
+
+    # Returns the Senior Executive involved in the change, or None for Aspiring Professionals.
+    def get_executive(self):
+        if self.entity_type == ChangeRecord.EXECUTIVE:
+            return self.entity
+        if self.entity_type == ChangeRecord.BOOKING:
+            return self.entity.get_senior_executive()
+        return None
+
+    # Returns the industry the change belongs to.
+    def get_industry(self):
+        if self.entity_type == ChangeRecord.BOOKING:
+            return self.entity.get_senior_executive().get_industry()
+        return self.entity.get_industry()
+
+    # Returns a string representation of the change.
+    def __str__(self):
+        return self.event.get_description()
+
+#______________________________________________________________________________________
+
+"""
+    Raised to the mutating caller when a ChangeSubscription with the RAISE overflow policy
+    (or a BLOCK subscription that cannot wait) has a full queue. The mutation itself has
+    already been applied and logged; the error tells the producer to slow down.
+"""
+
+class ChangeFeedOverflowError(Exception):
+    pass
+
+#______________________________________________________________________________________
+
+"""
+    Represents a subscription to the ChangeFeed.
+
+    A subscription either calls a callback synchronously for every matching record, which
+    naturally holds the producer back until the callback returns, or puts records on a bounded
+    asyncio.Queue to be consumed with `await subscription.get()` or `async for change in
+    subscription`. What happens when the queue is full depends on the overflow policy:
+
+    - DROP_OLDEST: the oldest record is dropped and counted, and the next get() returns an
+      OVERFLOW ChangeRecord before any other record so the consumer knows to resync.
+    - RAISE: ChangeFeedOverflowError is raised to the mutating caller once every other
+      subscription has received the record. The record counts as dropped, so the next get()
+      also returns an OVERFLOW record.
+    - BLOCK: a producer on another thread waits until the consumer makes room. A producer on
+      the event loop thread cannot wait for its own consumer and gets ChangeFeedOverflowError.
+      BLOCK subscriptions must be created from a running event loop.
+
+    Filters are optional; entity_type must match exactly, executive (a name) and industry are
+    compared case-insensitively like the rest of the platform.
+
+    Attributes:
+    - callback: Callable receiving each matching ChangeRecord, or None for queue delivery.
+    - queue: Bounded asyncio.Queue receiving matching records when there is no callback.
+    - overflow: Overflow policy used when the queue is full.
+    - dropped: Number of records dropped because the queue was full.
+    - reported: Number of dropped records already reported through an OVERFLOW record.
+"""
+
+class ChangeSubscription:
+    DEFAULT_MAXSIZE = 1000
+
+    DROP_OLDEST = "drop_oldest"
+    RAISE = "raise"
+    BLOCK = "block"
+    OVERFLOW_POLICIES = [DROP_OLDEST, RAISE, BLOCK]
+
+    def __init__(self, feed, callback=None, entity_type=None, executive=None, industry=None,
+                 maxsize=DEFAULT_MAXSIZE, overflow=DROP_OLDEST):
+        if overflow not in ChangeSubscription.OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        self.feed = feed
+        self.callback = callback
+        self.entity_type = entity_type
+        self.executive = executive.lower() if executive else None
+        self.industry = industry.lower() if industry else None
+        self.queue = None if callback else asyncio.Queue(maxsize)
+        self.overflow = overflow
+        self.dropped = 0
+        self.reported = 0
+        try:
+            self.loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.loop = None
+        if self.queue is not None and overflow == ChangeSubscription.BLOCK and self.loop is None:
+            raise ValueError("Blocking subscriptions must be created from a running event loop.")
+
+    # Returns whether a change record passes the subscription filters.
+    def matches(self, change):
+        if self.entity_type and change.get_entity_type() != self.entity_type:
+            return False
+        if self.executive:
+            executive = change.get_executive()
+            if executive is None or executive.get_name().lower() != self.executive:
+                return False
+        if self.industry and change.get_industry().lower() != self.industry:
+            return False
+        return True
+
+    # Delivers a change record to the callback or the queue.
+    def deliver(self, change):
+        if self.callback:
+            self.callback(change)
+            return
+        if self.loop is not None and self.loop.is_running() and not self.on_loop_thread():
+            future = asyncio.run_coroutine_threadsafe(self.put(change), self.loop)
+            if self.overflow != ChangeSubscription.DROP_OLDEST:
+                # Wait so the producer is held back (BLOCK) or sees the error (RAISE)
+                future.result()
+        else:
+            self.enqueue(change)
+
+    # Returns whether the caller runs on the event loop the subscription was created in.
+    def on_loop_thread(self):
+        try:
+            return asyncio.get_running_loop() is self.loop
+        except RuntimeError:
+            return False
+
+    # Puts a change record on the queue from the event loop, waiting for room when blocking.
+    async def put(self, change):
+        if self.overflow == ChangeSubscription.BLOCK:
+            await self.queue.put(change)
+        else:
+            self.enqueue(change)
+
+    # Puts a change record on the queue without waiting, applying the overflow policy when full.
+    def enqueue(self, change):
+        if self.queue.full():
+            if self.overflow != ChangeSubscription.DROP_OLDEST:
+                # The record is lost for this subscriber too, so its next get() asks for a resync
+                self.dropped += 1
+                raise ChangeFeedOverflowError(f"Change subscription queue is full ({self.queue.maxsize} records).")
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(change)
+
+    # Waits for the next change record on the queue. After records were dropped, an OVERFLOW
+    # record is returned first.
+    async def get(self):
+        if self.dropped > self.reported:
+            missed = self.dropped - self.reported
+            self.reported = self.dropped
+            return ChangeRecord(None, ChangeRecord.OVERFLOW, None,
+                                Event(f"{missed} change records dropped; resync required."))
+        return await self.queue.get()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        return await self.get()
+
+    # Stops receiving change records.
+    def unsubscribe(self):
+        self.feed.unsubscribe(self)
+
+#______________________________________________________________________________________
+
+"""
+    Publishes ChangeRecords for every platform mutation to its subscribers.
+
+    Singleton class, like EventLog, so Booking.set_day can publish without a Platform reference.
+    Publishing costs nothing when there are no subscribers. A failing callback is logged as an
+    event and does not affect the mutation or other subscribers; only ChangeFeedOverflowError
+    is passed on to the mutating caller, after all subscribers have received the records.
+
+    Attributes:
+    - subscriptions: List of active ChangeSubscription objects.
+"""
+class ChangeFeed:
+    _instance = None
+
+    def __new__(cls):
+        if not cls._instance:
+            cls._instance = super(ChangeFeed, cls).__new__(cls)
+            cls._instance.subscriptions = []
+            cls._instance.lock = threading.Lock()
+        return cls._instance
+
+    # Registers a new subscription. Without a callback, records are delivered on a bounded queue
+    # handled according to the overflow policy.
+    def subscribe(self, callback=None, entity_type=None, executive=None, industry=None,
+                  maxsize=ChangeSubscription.DEFAULT_MAXSIZE, overflow=ChangeSubscription.DROP_OLDEST):
+        subscription = ChangeSubscription(self, callback, entity_type, executive, industry, maxsize, overflow)
+        with self.lock:
+            self.subscriptions = self.subscriptions + [subscription]
+        return subscription
+
+    # Removes a subscription.
+    def unsubscribe(self, subscription):
+        with self.lock:
+            self.subscriptions = [s for s in self.subscriptions if s is not subscription]
+
+    # Publishes a change record to every matching subscription. An overflow error is raised
+    # only after every other subscription has received the record.
+    def publish(self, change):
+        overflow = self.deliver(change)
+        if overflow:
+            raise overflow
+
+    # Publishes several change records in order, raising the first overflow error at the end.
+    def publish_many(self, changes):
+        if not self.subscriptions:
+            return
+        overflow = None
+        for change in changes:
+            error = self.deliver(change)
+            overflow = overflow or error
+        if overflow:
+            raise overflow
+
+    # Delivers a change record to every matching subscription and returns the first overflow
+    # error instead of raising it.
+    def deliver(self, change):
+        overflow = None
+        for subscription in self.subscriptions:
+            if subscription.matches(change):
+                try:
+                    subscription.deliver(change)
+                except ChangeFeedOverflowError as error:
+                    overflow = overflow or error
+                except Exception as error:
+                    EventLog().log_event(Event(f"Change subscriber failed: {error}"))
+        return overflow
+
+    # Returns all active subscriptions.
+    def get_subscriptions(self):
+        return self.subscriptions
+
+#______________________________________________________________________________________
+
+"""
+    Allocates Aspiring Professionals to Senior Executives in fair rotation.
+
+    Professionals are kept in one min-heap per industry, ordered by booking frequency and then
+    by arrival, so the professional with the fewest bookings is always served first. When a
+    frequency changes a fresh entry is pushed and the old one is left in the heap as stale;
+    stale entries are discarded when they reach the top (lazy invalidation). Every update and
+    allocation therefore costs O(log N) instead of re-sorting all professionals.
+
+    Attributes:
+    - heaps: Dictionary mapping a lowercased industry to its heap of [frequency, arrival, order, professional] entries.
+    - entries: Dictionary mapping a professional to its current (valid) heap entry.
+    - arrivals: Dictionary mapping a professional to the order in which they were added.
+    - stale: Number of invalidated entries still sitting in the heaps.
+"""
+
+class FairRotationAllocator:
+    REMOVED = None
+    COMPACT_FACTOR = 2
+
+    def __init__(self):
+        self.heaps = {}
+        self.entries = {}
+        self.arrivals = {}
+        self.arrival_counter = itertools.count()
+        self.counter = itertools.count()
+        self.stale = 0
+
+    # Starts tracking an Aspiring Professional and listens for frequency changes.
+    def add(self, professional):
+        if professional in self.entries:
+            return
+        professional.add_frequency_listener(self.update)
+        self.arrivals[professional] = next(self.arrival_counter)
+        self.push(professional)
+
+    # Stops tracking an Aspiring Professional. Its heap entry is invalidated in place.
+    def remove(self, professional):
+        entry = self.entries.pop(professional, None)
+        if entry is not None:
+            del self.arrivals[professional]
+            self.invalidate(entry)
+            professional.remove_frequency_listener(self.update)
+
+    # Re-queues an Aspiring Professional under their current frequency.
+    def update(self, professional):
+        entry = self.entries.get(professional)
+        if entry is None or entry[0] == professional.get_frequency():
+            return
+        self.invalidate(entry)
+        self.push(professional)
+
+    # Marks a heap entry as stale, compacting the heaps once stale entries dominate.
+    def invalidate(self, entry):
+        entry[-1] = FairRotationAllocator.REMOVED
+        self.stale += 1
+        if self.stale > FairRotationAllocator.COMPACT_FACTOR * len(self.entries) + 64:
+            self.compact()
+
+    # Drops all stale entries and re-heapifies in O(N).
+    def compact(self):
+        for industry, heap in self.heaps.items():
+            heap[:] = [entry for entry in heap if entry[-1] is not FairRotationAllocator.REMOVED]
+            heapq.heapify(heap)
+        self.stale = 0
+
+    # Pushes a fresh heap entry for an Aspiring Professional. The order counter keeps entries
+    # unique, so stale and live entries of the same professional never compare professionals.
+    def push(self, professional):
+        entry = [professional.get_frequency(), self.arrivals[professional], next(self.counter), professional]
+        self.entries[professional] = entry
+        heap = self.heaps.setdefault(professional.get_industry().lower(), [])
+        heapq.heappush(heap, entry)
+
+    # Returns the least frequently booked Aspiring Professional in an industry, or None.
+    def next_professional(self, industry):
+        heap = self.heaps.get(industry.lower())
+        while heap:
+            professional = heap[0][-1]
+            if professional is not FairRotationAllocator.REMOVED:
+                return professional
+            heapq.heappop(heap)
+            self.stale -= 1
+        return None
+
+    # Returns whether an Aspiring Professional is being tracked.
+    def __contains__(self, professional):
+        return professional in self.entries
+
+    # Returns the number of tracked Aspiring Professionals.
+    def __len__(self):
+        return len(self.entries)
+
+#______________________________________________________________________________________
+
 """
     Represents the platform managing Aspiring Professionals, Senior Executives, and bookings.
 
@@ -222,6 +943,7 @@ class EventLog:
     - aspiring_professionals: List of AspiringProfessional objects.
     - senior_executives: List of SeniorExecutive objects.
     - bookings: List of Booking objects.
+    - allocator: FairRotationAllocator tracking the Aspiring Professionals by booking frequency.
 """
 
 class Platform:
@@ -229,16 +951,21 @@ class Platform:
         self.aspiring_professionals = []
         self.senior_executives = []
         self.bookings = []
+        self.allocator = FairRotationAllocator()
 
     # Adds a new Aspiring Professional to the platform.
     def add_aspiring_professional(self, professional):
         self.aspiring_professionals.append(professional)
-        EventLog().log_event(Event(f"Aspiring Professional added: {professional.get_name()}"))
+        self.allocator.add(professional)
+        EventLog().log_change(ChangeRecord(ChangeRecord.PROFESSIONAL, ChangeRecord.ADDED, professional,
+                                           Event(f"Aspiring Professional added: {professional.get_name()}")))
 
     # Removes an Aspiring Professional from the platform.
     def remove_aspiring_professional(self, professional):
         self.aspiring_professionals.remove(professional)
-        EventLog().log_event(Event(f"Aspiring Professional removed: {professional.get_name()}"))
+        self.allocator.remove(professional)
+        EventLog().log_change(ChangeRecord(ChangeRecord.PROFESSIONAL, ChangeRecord.REMOVED, professional,
+                                           Event(f"Aspiring Professional removed: {professional.get_name()}")))
 
     # Returns all Aspiring Professionals in the platform.
     def get_aspiring_professionals(self):
@@ -247,31 +974,285 @@ class Platform:
     # Adds a new Senior Executive to the platform.
     def add_senior_executive(self, executive):
         self.senior_executives.append(executive)
-        EventLog().log_event(Event(f"Senior Executive added: {executive.get_name()}"))
+        EventLog().log_change(ChangeRecord(ChangeRecord.EXECUTIVE, ChangeRecord.ADDED, executive,
+                                           Event(f"Senior Executive added: {executive.get_name()}")))
 
     # Removes a Senior Executive from the platform.
     def remove_senior_executive(self, executive):
         self.senior_executives.remove(executive)
-        EventLog().log_event(Event(f"Senior Executive removed: {executive.get_name()}"))
+        EventLog().log_change(ChangeRecord(ChangeRecord.EXECUTIVE, ChangeRecord.REMOVED, executive,
+                                           Event(f"Senior Executive removed: {executive.get_name()}")))
 
     # Returns all Senior Executives in the platform.
     def get_senior_executives(self):
         return self.senior_executives
 
+    # Returns the Senior Executives in an industry (case-insensitive).
+    def get_senior_executives_by_industry(self, industry):
+        if isinstance(self.senior_executives, SeniorExecutiveCatalog):
+            return self.senior_executives.get_by_industry(industry)
+        return [executive for executive in self.senior_executives
+                if executive.get_industry().lower() == industry.lower()]
+
+    # Replaces the Senior Executives with a lazily loaded catalog file.
+    def open_senior_executive_catalog(self, path):
+        self.senior_executives = SeniorExecutiveCatalog(path)
+        EventLog().log_event(Event(f"Senior Executive catalog opened: {path}"))
+        return self.senior_executives
+
     # Adds a new booking between an Aspiring Professional and a Senior Executive.
     def add_booking(self, booking):
         self.bookings.append(booking)
-        EventLog().log_event(Event(f"Booking added: {booking.get_aspiring_professional().get_name()} with {booking.get_senior_executive().get_name()}"))
+        EventLog().log_change(ChangeRecord(ChangeRecord.BOOKING, ChangeRecord.ADDED, booking, Event(
+            f"Booking added: {booking.get_aspiring_professional().get_name()} with {booking.get_senior_executive().get_name()}"
+        )))
 
     # Removes a booking from the platform.
     def remove_booking(self, booking):
         self.bookings.remove(booking)
-        EventLog().log_event(Event(f"Booking removed: {booking.get_aspiring_professional().get_name()} with {booking.get_senior_executive().get_name()}"))
+        EventLog().log_change(ChangeRecord(ChangeRecord.BOOKING, ChangeRecord.REMOVED, booking, Event(
+            f"Booking removed: {booking.get_aspiring_professional().get_name()} with {booking.get_senior_executive().get_name()}"
+        )))
 
     # Getter for bookings
     def get_bookings(self):
         return self.bookings
 
+    # Returns a PlatformBatch that stages mutations and applies them atomically on commit.
+    def batch(self):
+        return PlatformBatch(self)
+
+    # Books a Senior Executive with the least frequently booked Aspiring Professional in their industry.
+    # Returns the new booking, or None if no Aspiring Professional is available.
+    def allocate_booking(self, executive, day):
+        professional = self.allocator.next_professional(executive.get_industry())
+        if professional is None:
+            return None
+        booking = Booking(professional, executive, day)
+        self.add_booking(booking)
+        return booking
+
+    # Allocates one booking per Senior Executive for the given day, serving the least
+    # frequently booked Aspiring Professionals first. Returns the list of new bookings.
+    def allocate_week(self, executives, day):
+        bookings = []
+        for executive in executives:
+            booking = self.allocate_booking(executive, day)
+            if booking is not None:
+                bookings.append(booking)
+        return bookings
+
+#______________________________________________________________________________________
+
+"""
+    Stages many Platform mutations and applies them as a single transaction.
+
+    Mutations are only recorded until commit() is called (or the `with` block exits without
+    an exception). Commit validates every staged operation in order, builds the new lists in
+    one pass (a lazy SeniorExecutiveCatalog is updated in place instead of being loaded and
+    rebuilt), applies booking day changes and net frequency changes once per object, writes
+    all events to the EventLog in a single call and then publishes them on the ChangeFeed.
+    If validation or applying fails, the platform is left exactly as it was before the commit.
+
+    Usage:
+        with platform.batch() as batch:
+            batch.set_day(booking, "Tue")
+            batch.cancel_booking(other_booking)
+
+    Attributes:
+    - platform: The Platform the mutations are applied to.
+    - operations: List of staged (action, kind, target, argument) tuples.
+    - committed: Whether the batch has already been committed.
+"""
+
+class PlatformBatch:
+    PROFESSIONAL = ChangeRecord.PROFESSIONAL
+    EXECUTIVE = ChangeRecord.EXECUTIVE
+    BOOKING = ChangeRecord.BOOKING
+
+    def __init__(self, platform):
+        self.platform = platform
+        self.operations = []
+        self.committed = False
+
+    def __enter__(self):
+        return self
+
+    # Commits the staged mutations, or discards them if the block raised.
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.operations.clear()
+        return False
+
+    # Staging methods, mirroring the Platform and Booking mutators
+    def add_aspiring_professional(self, professional):
+        self.stage("add", PlatformBatch.PROFESSIONAL, professional)
+
+    def remove_aspiring_professional(self, professional):
+        self.stage("remove", PlatformBatch.PROFESSIONAL, professional)
+
+    def add_senior_executive(self, executive):
+        self.stage("add", PlatformBatch.EXECUTIVE, executive)
+
+    def remove_senior_executive(self, executive):
+        self.stage("remove", PlatformBatch.EXECUTIVE, executive)
+
+    def add_booking(self, booking):
+        self.stage("add", PlatformBatch.BOOKING, booking)
+
+    def remove_booking(self, booking):
+        self.stage("remove", PlatformBatch.BOOKING, booking)
+
+    # Removes a booking and decreases the Aspiring Professional's frequency, like deleting a booking.
+    def cancel_booking(self, booking):
+        self.stage("cancel", PlatformBatch.BOOKING, booking)
+
+    def set_day(self, booking, day):
+        self.stage("set_day", PlatformBatch.BOOKING, booking, day)
+
+    # Records a mutation to be applied on commit.
+    def stage(self, action, kind, target, argument=None):
+        if self.committed:
+            raise RuntimeError("Batch has already been committed.")
+        self.operations.append((action, kind, target, argument))
+
+    # Returns the platform list holding entities of the given kind.
+    def collection(self, kind):
+        if kind == PlatformBatch.PROFESSIONAL:
+            return self.platform.aspiring_professionals
+        if kind == PlatformBatch.EXECUTIVE:
+            return self.platform.senior_executives
+        return self.platform.bookings
+
+    # Returns the display name used in event descriptions for an entity.
+    @staticmethod
+    def describe(kind, target):
+        if kind == PlatformBatch.BOOKING:
+            return f"{target.get_aspiring_professional().get_name()} with {target.get_senior_executive().get_name()}"
+        return target.get_name()
+
+    """
+    Validates the staged operations in order and computes their combined effect
+    without touching the platform.
+
+    Raises ValueError if an operation removes or reschedules something that is not on
+    the platform at that point of the batch.
+    """
+    def plan(self):
+        counts = {}
+        additions = {}
+        removals = {}
+        days = {}
+        deltas = {}
+        changes = []
+
+        for action, kind, target, argument in self.operations:
+            collection = self.collection(kind)
+            catalog = isinstance(collection, SeniorExecutiveCatalog)
+            if kind not in counts:
+                # A lazy catalog is checked per target instead of being loaded to count it
+                counts[kind] = Counter() if catalog else Counter(collection)
+            if catalog and target not in counts[kind]:
+                counts[kind][target] = 1 if target in collection else 0
+
+            if action == "set_day":
+                if counts[kind][target] <= 0:
+                    raise ValueError(f"{kind} not on the platform: {PlatformBatch.describe(kind, target)}")
+                old_day = days.get(target, target.get_day())
+                changes.append(ChangeRecord(kind, ChangeRecord.DAY_CHANGED, target, Event(
+                    f"Booking time changed from {old_day} to {argument} for {PlatformBatch.describe(kind, target)}"
+                ), old_day, argument))
+                days[target] = argument
+                continue
+
+            if kind not in additions:
+                additions[kind] = []
+                removals[kind] = Counter()
+
+            if action == "add":
+                counts[kind][target] += 1
+                additions[kind].append(target)
+                changes.append(ChangeRecord(kind, ChangeRecord.ADDED, target,
+                                            Event(f"{kind} added: {PlatformBatch.describe(kind, target)}")))
+            else:
+                if counts[kind][target] <= 0:
+                    raise ValueError(f"{kind} not on the platform: {PlatformBatch.describe(kind, target)}")
+                counts[kind][target] -= 1
+                removals[kind][target] += 1
+                changes.append(ChangeRecord(kind, ChangeRecord.REMOVED, target,
+                                            Event(f"{kind} removed: {PlatformBatch.describe(kind, target)}")))
+                if action == "cancel":
+                    professional = target.get_aspiring_professional()
+                    deltas[professional] = deltas.get(professional, 0) - 1
+
+        lists = {}
+        catalog_updates = {}
+        for kind in additions:
+            if isinstance(self.collection(kind), SeniorExecutiveCatalog):
+                catalog_updates[kind] = (additions[kind], list(removals[kind].elements()))
+                continue
+            pending = removals[kind]
+            merged = []
+            for item in itertools.chain(self.collection(kind), additions[kind]):
+                if pending[item] > 0:
+                    pending[item] -= 1
+                else:
+                    merged.append(item)
+            lists[kind] = merged
+
+        return lists, catalog_updates, counts, additions, days, deltas, changes
+
+    # Applies the staged operations atomically and logs their events in one write.
+    def commit(self):
+        if self.committed:
+            raise RuntimeError("Batch has already been committed.")
+        lists, catalog_updates, counts, additions, days, deltas, changes = self.plan()
+
+        snapshots = {kind: list(self.collection(kind)) for kind in lists}
+        catalog_snapshots = {kind: self.collection(kind).snapshot() for kind in catalog_updates}
+        old_days = {booking: booking.get_day() for booking in days}
+        old_frequencies = {professional: professional.get_frequency() for professional in deltas}
+        touched = set(additions.get(PlatformBatch.PROFESSIONAL, ()))
+        touched.update(professional for professional in snapshots.get(PlatformBatch.PROFESSIONAL, ())
+                       if counts[PlatformBatch.PROFESSIONAL][professional] <= 0)
+
+        try:
+            for kind, items in lists.items():
+                self.collection(kind)[:] = items
+            for kind, (added, removed) in catalog_updates.items():
+                self.collection(kind).apply(added, removed)
+            for booking, day in days.items():
+                booking.day = day
+            for professional, delta in deltas.items():
+                professional.adjust_frequency(delta)
+            self.sync_allocator(touched, counts)
+        except Exception:
+            for kind, items in snapshots.items():
+                self.collection(kind)[:] = items
+            for kind, state in catalog_snapshots.items():
+                self.collection(kind).restore(state)
+            for booking, day in old_days.items():
+                booking.day = day
+            for professional, frequency in old_frequencies.items():
+                professional.restore_frequency(frequency)
+            self.sync_allocator(touched, {PlatformBatch.PROFESSIONAL: Counter(self.platform.aspiring_professionals)})
+            raise
+
+        self.committed = True
+        self.operations.clear()
+        EventLog().log_changes(changes)
+
+    # Adds or removes the touched Aspiring Professionals from the allocator based on their presence.
+    def sync_allocator(self, professionals, counts):
+        present = counts.get(PlatformBatch.PROFESSIONAL, Counter())
+        for professional in professionals:
+            if present[professional] > 0:
+                self.platform.allocator.add(professional)
+            else:
+                self.platform.allocator.remove(professional)
+
 
 #______________________________________________________________________________________
 
@@ -311,10 +1292,11 @@ class Booking:
 
     # Logs event of changing the date of booking
     def set_day(self, day):
-        EventLog().log_event(Event(
-            f"Booking time changed from {self.get_day()} to {day} for {self.aspiring_professional.get_name()} with {self.senior_executive.get_name()}"
-        ))
+        old_day = self.get_day()
         self.day = day
+        EventLog().log_change(ChangeRecord(ChangeRecord.BOOKING, ChangeRecord.DAY_CHANGED, self, Event(
+            f"Booking time changed from {old_day} to {day} for {self.aspiring_professional.get_name()} with {self.senior_executive.get_name()}"
+        ), old_day, day))
 
 
     # Method to display booking details
@@ -333,37 +1315,41 @@ and bookings. It interacts with the `Platform` class to perform various tasks.
 class PlatformApp:
     platform = Platform()
 
-    # Dummy data 
+    # Dummy data
+    NAMES = [
+        "Mohammed", "Ali", "Fatima", "Aisha", "Omar", "Yusuf", "Sana", "Imran",
+        "Layla", "Zaynab", "Ibrahim", "Huda", "Ahmad", "Safiya", "Salim",
+        "Jamal", "Ayesha", "Yasin", "Nadia", "Hamza", "Zara", "Amir", "Hana",
+        "Khalid", "Safia", "Bilal", "Mariam", "Tariq", "Saida", "Jamil"
+    ]
+    INDUSTRIES = [
+        "Technology", "Healthcare", "Education", "Finance", "Engineering",
+        "Media", "Consulting", "Retail", "Accounting", "Marketing",
+        "Hospitality", "Business", "Engineering", "Arts",
+        "Journalism", "Government", "Sciences",
+        "Entertainment", "Insurance", "Construction", "Health"
+    ]
+    COMPANIES = [
+        "Pioneer Solutions", "Evergreen Enterprises", "Summit Innovations", "Vanguard Holdings",
+        "Horizon Group", "Eclipse Ventures", "Prime Partners", "Zenith Global", "Infinity Solutions",
+        "Serenity Enterprises", "Catalyst Holdings", "Apex Strategies", "Tranquil Systems",
+        "Ascendant Technologies", "Fusion Dynamics", "Elevate Ventures", "Stratosphere Solutions",
+        "Equinox Strategies", "Aurora Enterprises", "Synergy Solutions"
+    ]
+    TITLES = [
+        "Chief Executive Officer", "Managing Director", "Director of Operations", "Executive Vice President",
+        "Senior Manager", "Head of Strategy", "Principal Consultant", "General Manager",
+        "Chief Financial Officer", "Chief Operating Officer", "Chief Marketing Officer", "Chief Technology Officer",
+        "Senior Analyst", "Senior Advisor", "Business Development Manager", "Project Manager",
+        "Operations Manager", "Product Manager", "Human Resources Director", "Finance Director"
+    ]
+
     @staticmethod
     def initialize_platform():
-        names = [
-            "Mohammed", "Ali", "Fatima", "Aisha", "Omar", "Yusuf", "Sana", "Imran",
-            "Layla", "Zaynab", "Ibrahim", "Huda", "Ahmad", "Safiya", "Salim",
-            "Jamal", "Ayesha", "Yasin", "Nadia", "Hamza", "Zara", "Amir", "Hana",
-            "Khalid", "Safia", "Bilal", "Mariam", "Tariq", "Saida", "Jamil"
-        ]
-        industries = [
-            "Technology", "Healthcare", "Education", "Finance", "Engineering",
-            "Media", "Consulting", "Retail", "Accounting", "Marketing",
-            "Hospitality", "Business", "Engineering", "Arts",
-            "Journalism", "Government", "Sciences",
-            "Entertainment", "Insurance", "Construction", "Health"
-        ]
-        companies = [
-            "Pioneer Solutions", "Evergreen Enterprises", "Summit Innovations", "Vanguard Holdings",
-            "Horizon Group", "Eclipse Ventures", "Prime Partners", "Zenith Global", "Infinity Solutions",
-            "Serenity Enterprises", "Catalyst Holdings", "Apex Strategies", "Tranquil Systems",
-            "Ascendant Technologies", "Fusion Dynamics", "Elevate Ventures", "Stratosphere Solutions",
-            "Equinox Strategies", "Aurora Enterprises", "Synergy Solutions"
-        ]
-        titles = [
-            "Chief Executive Officer", "Managing Director", "Director of Operations", "Executive Vice President",
-            "Senior Manager", "Head of Strategy", "Principal Consultant", "General Manager",
-            "Chief Financial Officer", "Chief Operating Officer", "Chief Marketing Officer", "Chief Technology Officer",
-            "Senior Analyst", "Senior Advisor", "Business Development Manager", "Project Manager",
-            "Operations Manager", "Product Manager", "Human Resources Director", "Finance Director"
-        ]
-        interests = industries
+        names = PlatformApp.NAMES
+        industries = PlatformApp.INDUSTRIES
+        companies = PlatformApp.COMPANIES
+        titles = PlatformApp.TITLES
 
         for i, name in enumerate(names):
             industry = industries[i % len(industries)]
@@ -568,12 +1554,7 @@ class PlatformApp:
     """
     @staticmethod
     def display_executives_by_industry(name, industry):
-        executives = []
-
-        # Filter executives by industry
-        for executive in PlatformApp.platform.get_senior_executives():
-            if executive.industry.lower() == industry.lower():
-                executives.append(executive)
+        executives = PlatformApp.platform.get_senior_executives_by_industry(industry)
 
         if not executives:
             print("No executives found in the specified industry.")
@@ -717,12 +1698,16 @@ class PlatformApp:
     """
     The main entry point of the application.
 
-    This method initializes the platform with dummy data and starts the main application loop,
+    This method initializes the platform with dummy data, or lazily opens a Senior Executive
+    catalog file when catalog_path is given, and starts the main application loop,
     displaying the menu and handling user input to perform various operations.
     """
     @staticmethod
-    def main():
-        PlatformApp.initialize_platform()
+    def main(catalog_path=None):
+        if catalog_path:
+            PlatformApp.platform.open_senior_executive_catalog(catalog_path)
+        else:
+            PlatformApp.initialize_platform()
 
         while True:
             PlatformApp.display_menu()
@@ -754,4 +1739,4 @@ class PlatformApp:
                 print("Invalid choice. Please enter a number from 1 to 10.")
 
 if __name__ == "__main__":
-    PlatformApp.main()
\ No newline at end of file
+    PlatformApp.main(sys.argv[1] if len(sys.argv) > 1 else None)
\ No newline at end of file
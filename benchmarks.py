@@ -0,0 +1,117 @@
+import argparse
+import csv
+import os
+import tempfile
+import time
+
+from PlatformApp import EventLog, Platform, PlatformApp, SeniorExecutive, SeniorExecutiveCatalog
+from workload import ReplayHarness, WorkloadGenerator
+
+
+"""
+    Benchmarks for the platform.
+
+    Run with `python benchmarks.py [--sizes 1000 100000 ...]`. Every benchmark returns a
+    dictionary of timings in seconds and is printed as one row of a table.
+"""
+
+#______________________________________________________________________________________
+
+"""
+    Measures startup time for a catalog of the given size.
+
+    - eager: reading every row and adding each Senior Executive to the platform before the
+      menu can appear, the way initialize_platform does.
+    - lazy_open: opening the catalog as a memory-mapped SeniorExecutiveCatalog.
+    - lazy_first_op: opening the catalog and completing a first operation (looking up one
+      Senior Executive).
+    - lazy_indexed: opening the catalog until its background indexes are ready.
+"""
+def bench_startup(size):
+    industries = PlatformApp.INDUSTRIES
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "catalog.csv")
+        SeniorExecutiveCatalog.write(path, (
+            SeniorExecutive(f"Executive {i}", industries[i % len(industries)], "Company", "Title",
+                            (i % 5 + 1) * 50, "Canada", [industries[i % len(industries)]])
+            for i in range(size)
+        ))
+
+        EventLog().get_events().clear()
+        start = time.perf_counter()
+        platform = Platform()
+        with open(path, newline="", encoding="utf-8") as file:
+            rows = csv.reader(file)
+            next(rows)
+            for name, industry, company, title, price, region, interests in rows:
+                price = SeniorExecutiveCatalog.parse_price(price)
+                platform.add_senior_executive(SeniorExecutive(name, industry, company, title, price,
+                                                              region, interests.split(";")))
+        eager = time.perf_counter() - start
+
+        EventLog().get_events().clear()
+        start = time.perf_counter()
+        platform = Platform()
+        catalog = platform.open_senior_executive_catalog(path)
+        lazy_open = time.perf_counter() - start
+        next(iter(platform.get_senior_executives()), None)
+        lazy_first_op = time.perf_counter() - start
+        catalog.wait_until_indexed()
+        lazy_indexed = time.perf_counter() - start
+        catalog.close()
+
+    EventLog().get_events().clear()
+    return {
+        "eager": eager,
+        "lazy_open": lazy_open,
+        "lazy_first_op": lazy_first_op,
+        "lazy_indexed": lazy_indexed,
+    }
+
+
+#______________________________________________________________________________________
+
+"""
+    Measures replaying a synthetic workload of the given size (size professionals, size / 10
+    executives and size operations) with one worker.
+
+    The trace is generated before the benchmark starts, so only Platform work is measured.
+
+    - setup: loading the entities with one Platform.batch().
+    - replay: replaying the operation trace, unthrottled.
+    - platform: time spent inside Platform operations during the replay.
+"""
+def bench_replay(size):
+    generator = WorkloadGenerator(professionals=size, executives=max(1, size // 10), operations=size)
+    operations = list(generator.generate_trace())
+    report = ReplayHarness(generator, sample_seconds=60).replay(operations)
+    EventLog().get_events().clear()
+    return {
+        "setup": report.setup_seconds,
+        "replay": report.elapsed,
+        "platform": report.busy_seconds,
+    }
+
+
+BENCHMARKS = {
+    "replay": bench_replay,
+    "startup": bench_startup,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run platform benchmarks.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--only", choices=sorted(BENCHMARKS), nargs="+", default=sorted(BENCHMARKS))
+    args = parser.parse_args()
+
+    for name in args.only:
+        print(f"\n--- {name} ---")
+        for size in args.sizes:
+            timings = BENCHMARKS[name](size)
+            row = "  ".join(f"{key}={value * 1000:.2f}ms" for key, value in timings.items())
+            print(f"size={size:<10} {row}")
+
+
+if __name__ == "__main__":
+    main()
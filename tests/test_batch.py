@@ -0,0 +1,130 @@
+import pytest
+
+from PlatformApp import AspiringProfessional, Booking, EventLog, Platform, SeniorExecutive
+
+
+def make_platform():
+    platform = Platform()
+    professionals = [AspiringProfessional(f"Professional {i}", "Technology", ["Technology"]) for i in range(2)]
+    executive = SeniorExecutive("Executive", "Technology", "Company", "Title", 50, "Canada", ["Technology"])
+    for professional in professionals:
+        platform.add_aspiring_professional(professional)
+    platform.add_senior_executive(executive)
+    bookings = [Booking(professional, executive, "Mon") for professional in professionals]
+    for booking in bookings:
+        platform.add_booking(booking)
+    return platform, professionals, executive, bookings
+
+
+def test_batch_applies_mutations_with_one_event_write():
+    platform, professionals, executive, bookings = make_platform()
+    newcomer = AspiringProfessional("Newcomer", "Technology", ["Technology"])
+    logged = len(EventLog().get_events())
+
+    with platform.batch() as batch:
+        batch.add_aspiring_professional(newcomer)
+        batch.set_day(bookings[0], "Tue")
+        batch.set_day(bookings[0], "Wed")
+        batch.remove_booking(bookings[1])
+
+    assert platform.get_aspiring_professionals() == professionals + [newcomer]
+    assert platform.get_bookings() == [bookings[0]]
+    assert bookings[0].get_day() == "Wed"
+    assert newcomer in platform.allocator
+    assert [event.get_description() for event in EventLog().get_events()[logged:]] == [
+        "Aspiring Professional added: Newcomer",
+        "Booking time changed from Mon to Tue for Professional 0 with Executive",
+        "Booking time changed from Tue to Wed for Professional 0 with Executive",
+        "Booking removed: Professional 1 with Executive",
+    ]
+
+
+def test_cancel_applies_net_frequency_change_once():
+    platform, professionals, executive, bookings = make_platform()
+    extra = Booking(professionals[0], executive, "Tue")
+    platform.add_booking(extra)
+    notified = []
+    professionals[0].add_frequency_listener(notified.append)
+
+    with platform.batch() as batch:
+        batch.cancel_booking(bookings[0])
+        batch.cancel_booking(extra)
+
+    assert professionals[0].get_frequency() == 0
+    assert professionals[1].get_frequency() == 1
+    assert notified == [professionals[0]]
+    assert platform.allocator.next_professional("Technology") is professionals[0]
+
+
+def test_validation_error_leaves_platform_unchanged():
+    platform, professionals, executive, bookings = make_platform()
+    orphan = Booking(professionals[0], executive, "Mon")
+    logged = len(EventLog().get_events())
+
+    with pytest.raises(ValueError):
+        with platform.batch() as batch:
+            batch.set_day(bookings[0], "Fri")
+            batch.remove_aspiring_professional(professionals[0])
+            batch.remove_booking(orphan)
+
+    assert platform.get_aspiring_professionals() == professionals
+    assert platform.get_bookings() == bookings
+    assert bookings[0].get_day() == "Mon"
+    assert professionals[0] in platform.allocator
+    assert len(EventLog().get_events()) == logged
+
+
+@pytest.mark.parametrize("stage", [
+    lambda batch, bookings, orphan: batch.set_day(orphan, "Fri"),
+    lambda batch, bookings, orphan: (batch.remove_booking(bookings[0]), batch.set_day(bookings[0], "Fri")),
+])
+def test_set_day_requires_booking_on_platform(stage):
+    platform, professionals, executive, bookings = make_platform()
+    orphan = Booking(professionals[0], executive, "Mon")
+
+    with pytest.raises(ValueError):
+        with platform.batch() as batch:
+            stage(batch, bookings, orphan)
+
+    assert orphan.get_day() == "Mon"
+    assert bookings[0].get_day() == "Mon"
+    assert platform.get_bookings() == bookings
+
+
+def test_failure_while_applying_rolls_back():
+    platform, professionals, executive, bookings = make_platform()
+    newcomer = AspiringProfessional("Newcomer", "Technology", ["Technology"])
+    logged = len(EventLog().get_events())
+
+    def failing_listener(professional):
+        raise RuntimeError("listener failed")
+
+    seen = []
+    professionals[0].add_frequency_listener(lambda professional: seen.append(professional.get_frequency()))
+    professionals[0].add_frequency_listener(failing_listener)
+
+    with pytest.raises(RuntimeError):
+        with platform.batch() as batch:
+            batch.add_aspiring_professional(newcomer)
+            batch.set_day(bookings[1], "Fri")
+            batch.cancel_booking(bookings[0])
+
+    assert platform.get_aspiring_professionals() == professionals
+    assert platform.get_bookings() == bookings
+    assert bookings[1].get_day() == "Mon"
+    assert professionals[0].get_frequency() == 1
+    assert newcomer not in platform.allocator
+    assert platform.allocator.entries[professionals[0]][0] == 1
+    assert seen == [0, 1]
+    assert len(EventLog().get_events()) == logged
+
+
+def test_exception_in_block_discards_staged_operations():
+    platform, professionals, executive, bookings = make_platform()
+
+    with pytest.raises(KeyError):
+        with platform.batch() as batch:
+            batch.remove_booking(bookings[0])
+            raise KeyError("abort")
+
+    assert platform.get_bookings() == bookings
@@ -0,0 +1,127 @@
+import pytest
+
+from PlatformApp import SeniorExecutive, SeniorExecutiveCatalog
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    path = tmp_path / "catalog.csv"
+    SeniorExecutiveCatalog.write(path, [
+        SeniorExecutive(f"Executive {i}", "Technology" if i % 2 else "Health", "Company, Inc", "Title",
+                        50 if i % 3 else 75.5, "Canada", ["Technology", "Math"])
+        for i in range(10)
+    ])
+    catalog = SeniorExecutiveCatalog(path)
+    yield catalog
+    catalog.close()
+
+
+def test_prices_keep_their_type(catalog):
+    catalog.wait_until_indexed()
+    assert catalog[1].get_price() == 50
+    assert isinstance(catalog[1].get_price(), int)
+    assert catalog[0].get_price() == 75.5
+    assert "Price: 50\n" in catalog[1].display_info()
+
+
+def test_getitem_skips_removed_records(catalog):
+    catalog.wait_until_indexed()
+    expected = list(catalog)
+    for i in [0, 3, 4, 9]:
+        catalog.remove(expected[i])
+    expected_live = [executive for i, executive in enumerate(expected) if i not in (0, 3, 4, 9)]
+    appended = SeniorExecutive("Appended", "Arts", "Company", "Title", 50, "Canada", [])
+    catalog.append(appended)
+    expected_live.append(appended)
+
+    assert len(catalog) == len(expected_live)
+    assert [catalog[i] for i in range(len(catalog))] == expected_live
+    assert catalog[-1] is appended
+    assert catalog[-2] is expected_live[-2]
+    with pytest.raises(IndexError):
+        catalog[len(catalog)]
+
+
+def test_bool_does_not_wait_for_index(tmp_path):
+    path = tmp_path / "empty.csv"
+    SeniorExecutiveCatalog.write(path, [])
+    empty = SeniorExecutiveCatalog(path)
+    assert not empty
+    empty.append(SeniorExecutive("Appended", "Arts", "Company", "Title", 50, "Canada", []))
+    assert empty
+    empty.close()
+
+
+def test_bool_returns_before_index_is_built(catalog, monkeypatch):
+    monkeypatch.setattr(catalog, "wait_until_indexed", lambda timeout=None: pytest.fail("bool waited for the index"))
+    assert catalog
+
+
+def test_write_rejects_line_breaks(tmp_path):
+    with pytest.raises(ValueError):
+        SeniorExecutiveCatalog.write(tmp_path / "catalog.csv", [
+            SeniorExecutive("B\nC", "Arts", "Company", "Title", 50, "Canada", []),
+        ])
+    with pytest.raises(ValueError):
+        SeniorExecutiveCatalog.write(tmp_path / "catalog.csv", [
+            SeniorExecutive("B", "Arts", "Company", "Title", 50, "Canada", ["Math;Physics"]),
+        ])
+
+
+def test_indexer_failure_is_raised_instead_of_hanging(tmp_path):
+    path = tmp_path / "catalog.csv"
+    path.write_text('name,industry,company,title,price,region,interests\n"B\nC",Arts,Company,Title,50,Canada,\n',
+                    encoding="utf-8")
+    catalog = SeniorExecutiveCatalog(path)
+    try:
+        assert catalog.indexed.wait(5)
+        with pytest.raises(ValueError):
+            len(catalog)
+        with pytest.raises(ValueError):
+            catalog.wait_until_indexed()
+        with pytest.raises(ValueError):
+            catalog[:] = []
+    finally:
+        catalog.close()
+
+
+def test_batch_updates_catalog_in_place(catalog):
+    from PlatformApp import AspiringProfessional, Booking, Platform
+
+    platform = Platform()
+    platform.senior_executives = catalog
+    first = catalog[0]
+    added = SeniorExecutive("Added", "Arts", "Company", "Title", 50, "Canada", [])
+
+    with platform.batch() as batch:
+        batch.add_senior_executive(added)
+        batch.remove_senior_executive(first)
+
+    assert first not in catalog
+    assert added in catalog
+    assert len(catalog.appended) == 1
+    assert len(catalog.removed) == 1
+    assert len(catalog.cache) == 1
+    assert len(catalog) == 10
+
+    with pytest.raises(ValueError):
+        with platform.batch() as batch:
+            batch.remove_senior_executive(first)
+
+    professional = AspiringProfessional("Professional", "Arts", [])
+    platform.add_aspiring_professional(professional)
+    booking = Booking(professional, added, "Mon")
+    platform.add_booking(booking)
+
+    def failing_listener(professional):
+        raise RuntimeError("listener failed")
+
+    professional.add_frequency_listener(failing_listener)
+    with pytest.raises(RuntimeError):
+        with platform.batch() as batch:
+            batch.remove_senior_executive(added)
+            batch.cancel_booking(booking)
+
+    assert added in catalog
+    assert first not in catalog
+    assert len(catalog) == 10
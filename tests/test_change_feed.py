@@ -0,0 +1,116 @@
+import asyncio
+
+import pytest
+
+from PlatformApp import (AspiringProfessional, Booking, ChangeFeed, ChangeFeedOverflowError, ChangeRecord,
+                         ChangeSubscription, Platform, SeniorExecutive)
+
+
+@pytest.fixture
+def booking():
+    platform = Platform()
+    professional = AspiringProfessional("Professional", "Technology", ["Technology"])
+    executive = SeniorExecutive("Executive", "Technology", "Company", "Title", 50, "Canada", ["Technology"])
+    platform.add_aspiring_professional(professional)
+    platform.add_senior_executive(executive)
+    booking = Booking(professional, executive, "Mon")
+    platform.add_booking(booking)
+    return booking
+
+
+def test_callback_receives_filtered_records(booking):
+    received = []
+    subscription = ChangeFeed().subscribe(received.append, entity_type=ChangeRecord.BOOKING, executive="executive")
+    try:
+        booking.set_day("Tue")
+        ChangeFeed().publish(ChangeRecord(ChangeRecord.EXECUTIVE, ChangeRecord.ADDED,
+                                          booking.get_senior_executive(), None))
+    finally:
+        subscription.unsubscribe()
+
+    assert [(change.get_action(), change.get_old_value(), change.get_new_value()) for change in received] == [
+        (ChangeRecord.DAY_CHANGED, "Mon", "Tue"),
+    ]
+
+
+def test_drop_oldest_reports_overflow(booking):
+    async def consume():
+        subscription = ChangeFeed().subscribe(maxsize=2)
+        try:
+            for day in ["Tue", "Wed", "Thu", "Fri"]:
+                booking.set_day(day)
+            return [await subscription.get() for _ in range(3)], subscription.dropped
+        finally:
+            subscription.unsubscribe()
+
+    changes, dropped = asyncio.run(consume())
+    assert dropped == 2
+    assert changes[0].get_action() == ChangeRecord.OVERFLOW
+    assert [change.get_new_value() for change in changes[1:]] == ["Thu", "Fri"]
+
+
+def test_raise_policy_raises_to_producer(booking):
+    async def produce():
+        subscription = ChangeFeed().subscribe(maxsize=1, overflow=ChangeSubscription.RAISE)
+        try:
+            booking.set_day("Tue")
+            with pytest.raises(ChangeFeedOverflowError):
+                booking.set_day("Wed")
+            assert subscription.queue.qsize() == 1
+            assert subscription.dropped == 1
+        finally:
+            subscription.unsubscribe()
+
+    asyncio.run(produce())
+
+
+def test_overflow_does_not_starve_later_subscribers(booking):
+    received = []
+
+    async def produce():
+        raising = ChangeFeed().subscribe(maxsize=1, overflow=ChangeSubscription.RAISE)
+        callback = ChangeFeed().subscribe(received.append, entity_type=ChangeRecord.BOOKING)
+        try:
+            booking.set_day("Tue")
+            with pytest.raises(ChangeFeedOverflowError):
+                booking.set_day("Wed")
+            with pytest.raises(ChangeFeedOverflowError):
+                ChangeFeed().publish_many([
+                    ChangeRecord(ChangeRecord.BOOKING, ChangeRecord.DAY_CHANGED, booking, None, "Wed", "Thu"),
+                    ChangeRecord(ChangeRecord.BOOKING, ChangeRecord.DAY_CHANGED, booking, None, "Thu", "Fri"),
+                ])
+            return await raising.get(), raising.dropped
+        finally:
+            raising.unsubscribe()
+            callback.unsubscribe()
+
+    first, dropped = asyncio.run(produce())
+    assert [change.get_new_value() for change in received] == ["Tue", "Wed", "Thu", "Fri"]
+    assert dropped == 3
+    assert first.get_action() == ChangeRecord.OVERFLOW
+
+
+def test_block_policy_holds_threaded_producer(booking):
+    async def consume():
+        subscription = ChangeFeed().subscribe(maxsize=1, overflow=ChangeSubscription.BLOCK)
+        try:
+            producer = asyncio.create_task(asyncio.to_thread(
+                lambda: [booking.set_day(day) for day in ["Tue", "Wed", "Thu"]]
+            ))
+            changes = [await subscription.get() for _ in range(3)]
+            await producer
+            return changes, subscription.dropped
+        finally:
+            subscription.unsubscribe()
+
+    changes, dropped = asyncio.run(consume())
+    assert [change.get_new_value() for change in changes] == ["Tue", "Wed", "Thu"]
+    assert dropped == 0
+
+
+def test_block_policy_requires_running_loop():
+    with pytest.raises(ValueError):
+        ChangeFeed().subscribe(overflow=ChangeSubscription.BLOCK)
+    with pytest.raises(ValueError):
+        ChangeFeed().subscribe(overflow="ignore")
+    assert ChangeFeed().get_subscriptions() == []
@@ -0,0 +1,126 @@
+import random
+
+from PlatformApp import AspiringProfessional, Booking, FairRotationAllocator, SeniorExecutive
+
+
+def make_professionals(count, industry="Technology"):
+    return [AspiringProfessional(f"Professional {i}", industry, [industry]) for i in range(count)]
+
+
+# Counts the compactions done by an allocator.
+def count_compactions(allocator):
+    calls = []
+    compact = allocator.compact
+
+    def counting_compact():
+        calls.append(allocator.stale)
+        compact()
+
+    allocator.compact = counting_compact
+    return calls
+
+
+def make_executive(industry="Technology"):
+    return SeniorExecutive("Executive", industry, "Company", "Title", 50, "Canada", [industry])
+
+
+# The expected professional: lowest frequency first, then earliest added.
+def expected_next(professionals):
+    return min(professionals, key=lambda professional: professional.get_frequency()) if professionals else None
+
+
+def test_next_professional_prefers_lowest_frequency_then_arrival():
+    allocator = FairRotationAllocator()
+    professionals = make_professionals(3)
+    for professional in professionals:
+        allocator.add(professional)
+    executive = make_executive()
+
+    assert allocator.next_professional("technology") is professionals[0]
+
+    Booking(professionals[0], executive, "Mon")
+    assert allocator.next_professional("Technology") is professionals[1]
+
+    Booking(professionals[1], executive, "Mon")
+    Booking(professionals[2], executive, "Mon")
+    assert allocator.next_professional("Technology") is professionals[0]
+
+    professionals[2].decrease_frequency()
+    assert allocator.next_professional("Technology") is professionals[2]
+
+
+def test_next_professional_matches_reference_across_compaction():
+    rng = random.Random(7)
+    allocator = FairRotationAllocator()
+    professionals = make_professionals(5)
+    for professional in professionals:
+        allocator.add(professional)
+    executive = make_executive()
+    compactions = count_compactions(allocator)
+
+    for _ in range(500):
+        professional = rng.choice(professionals)
+        if professional.get_frequency() and rng.random() < 0.5:
+            professional.decrease_frequency()
+        else:
+            Booking(professional, executive, "Mon")
+        assert allocator.next_professional("Technology") is expected_next(professionals)
+
+    assert compactions
+    assert sum(len(heap) for heap in allocator.heaps.values()) == len(allocator) + allocator.stale
+
+
+def test_compaction_keeps_order():
+    allocator = FairRotationAllocator()
+    professionals = make_professionals(3)
+    for professional in professionals:
+        allocator.add(professional)
+    executive = make_executive()
+    compactions = count_compactions(allocator)
+
+    for _ in range(100):
+        Booking(professionals[0], executive, "Mon")
+        professionals[0].decrease_frequency()
+    Booking(professionals[1], executive, "Mon")
+
+    assert compactions
+    assert allocator.next_professional("Technology") is professionals[0]
+    allocator.compact()
+    assert allocator.stale == 0
+    assert sum(len(heap) for heap in allocator.heaps.values()) == len(professionals)
+    assert allocator.next_professional("Technology") is professionals[0]
+
+
+def test_removed_professional_is_never_returned():
+    allocator = FairRotationAllocator()
+    professionals = make_professionals(3)
+    for professional in professionals:
+        allocator.add(professional)
+    executive = make_executive()
+
+    allocator.remove(professionals[0])
+    assert professionals[0] not in allocator
+    assert allocator.update not in professionals[0].frequency_listeners
+    assert allocator.next_professional("Technology") is professionals[1]
+
+    # Frequency changes after removal must not bring the professional back
+    Booking(professionals[1], executive, "Mon")
+    Booking(professionals[2], executive, "Mon")
+    professionals[0].increase_frequency()
+    professionals[0].decrease_frequency()
+    assert allocator.next_professional("Technology") is professionals[1]
+
+    allocator.remove(professionals[1])
+    allocator.remove(professionals[2])
+    assert allocator.next_professional("Technology") is None
+
+
+def test_industries_are_allocated_separately():
+    allocator = FairRotationAllocator()
+    technology = make_professionals(1, "Technology")[0]
+    health = make_professionals(1, "Health")[0]
+    allocator.add(technology)
+    allocator.add(health)
+
+    assert allocator.next_professional("health") is health
+    assert allocator.next_professional("Arts") is None
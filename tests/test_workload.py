@@ -0,0 +1,62 @@
+import pytest
+
+from workload import ReplayHarness, WorkloadGenerator
+
+
+def test_trace_is_seeded_and_consistent():
+    generator = WorkloadGenerator(seed=3, professionals=50, executives=10, operations=500)
+    trace = list(generator.generate_trace())
+
+    assert trace == list(WorkloadGenerator(seed=3, professionals=50, executives=10, operations=500).generate_trace())
+    assert [operation[0] for operation in trace] == sorted(operation[0] for operation in trace)
+    active = set()
+    for _, action, booking_id, *_ in trace:
+        if action == WorkloadGenerator.BOOK:
+            active.add(booking_id)
+        else:
+            assert booking_id in active
+            if action == WorkloadGenerator.CANCEL:
+                active.remove(booking_id)
+
+
+@pytest.mark.parametrize("settings", [
+    {"cancel_ratio": 0.6, "reschedule_ratio": 0.5},
+    {"burst_probability": 1.5},
+    {"base_rate": 0},
+    {"professionals": -1},
+])
+def test_invalid_settings_are_rejected(settings):
+    with pytest.raises(ValueError):
+        WorkloadGenerator(**settings)
+
+
+@pytest.mark.parametrize("concurrency", [1, 3])
+def test_replay_applies_every_operation(concurrency):
+    generator = WorkloadGenerator(professionals=50, executives=10, operations=500)
+    harness = ReplayHarness(generator, concurrency=concurrency)
+    report = harness.replay(generator.generate_trace())
+
+    cancels = sum(1 for operation in generator.generate_trace() if operation[1] == WorkloadGenerator.CANCEL)
+    books = sum(1 for operation in generator.generate_trace() if operation[1] == WorkloadGenerator.BOOK)
+    assert report.operations == 500
+    assert report.errors == 0
+    assert len(harness.platform.get_bookings()) == books - cancels
+    assert report.busy_seconds <= report.elapsed
+
+
+def test_paced_replay_follows_timestamps():
+    generator = WorkloadGenerator(professionals=10, executives=5, operations=20, base_rate=100, burst_rate=100)
+    operations = list(generator.generate_trace())
+    report = ReplayHarness(generator, speed=1).replay(operations)
+
+    assert report.elapsed >= operations[-1][0]
+    assert report.speed == 1
+
+
+def test_replay_reports_memory_against_baseline():
+    generator = WorkloadGenerator(professionals=50, executives=10, operations=200)
+    report = ReplayHarness(generator, trace_memory=True).replay(iter(generator.generate_trace()))
+
+    assert report.operations == 200
+    assert report.baseline_memory is not None
+    assert "above baseline" in report.display_report()
@@ -0,0 +1,503 @@
+import argparse
+import itertools
+import json
+import os
+import queue
+import random
+import threading
+import time
+import tracemalloc
+
+from PlatformApp import AspiringProfessional, Booking, EventLog, Platform, PlatformApp, SeniorExecutive
+
+
+"""
+    Synthetic workloads for capacity planning.
+
+    Generate a seeded trace and replay it headlessly against Platform:
+
+        python workload.py generate trace.jsonl --professionals 1000000 --operations 5000000
+        python workload.py replay trace.jsonl
+        python workload.py replay trace.jsonl --speed 10
+
+    The trace file only stores the generator settings and the operations; the entities are
+    regenerated from the seed when the trace is replayed, so traces stay small.
+"""
+
+#______________________________________________________________________________________
+
+"""
+    Generates seeded synthetic entities and an operation trace with realistic skew.
+
+    - Industry popularity follows a Zipf distribution (industry_skew is the exponent), so a
+      few industries receive most professionals, executives and bookings.
+    - Booking arrivals are bursty: a two-state (calm/burst) Markov-modulated Poisson process
+      with rates base_rate and burst_rate operations per second.
+    - Each operation reschedules or cancels an active booking with reschedule_ratio and
+      cancel_ratio respectively, and otherwise books a new coffee chat.
+
+    The same settings always produce the same entities and trace.
+
+    Attributes:
+    - settings: Dictionary of the generator settings, stored in the trace header.
+    - industries: List of industries, most popular first.
+    - executive_industries: Industry index of every Senior Executive.
+    - professional_industries: Industry index of every Aspiring Professional.
+"""
+
+class WorkloadGenerator:
+    DAYS = ["Mon", "Tue", "Wed", "Thu", "Fri"]
+
+    BOOK = "book"
+    RESCHEDULE = "reschedule"
+    CANCEL = "cancel"
+
+    def __init__(self, seed=0, professionals=1000, executives=100, operations=10000, industry_skew=1.1,
+                 base_rate=10.0, burst_rate=200.0, burst_probability=0.01, calm_probability=0.1,
+                 reschedule_ratio=0.2, cancel_ratio=0.1):
+        error = WorkloadGenerator.check_settings(professionals, executives, operations, base_rate, burst_rate,
+                                                 burst_probability, calm_probability, reschedule_ratio,
+                                                 cancel_ratio)
+        if error:
+            raise ValueError(error)
+        self.settings = {
+            "seed": seed,
+            "professionals": professionals,
+            "executives": executives,
+            "operations": operations,
+            "industry_skew": industry_skew,
+            "base_rate": base_rate,
+            "burst_rate": burst_rate,
+            "burst_probability": burst_probability,
+            "calm_probability": calm_probability,
+            "reschedule_ratio": reschedule_ratio,
+            "cancel_ratio": cancel_ratio,
+        }
+        self.industries = list(dict.fromkeys(PlatformApp.INDUSTRIES))
+        weights = [1 / rank ** industry_skew for rank in range(1, len(self.industries) + 1)]
+        self.cumulative_weights = list(itertools.accumulate(weights))
+
+        rng = random.Random(f"{seed}:entities")
+        self.executive_industries = self.draw_industries(rng, executives)
+        self.professional_industries = self.draw_industries(rng, professionals)
+
+        self.executives_by_industry = [[] for _ in self.industries]
+        for executive_id, industry in enumerate(self.executive_industries):
+            self.executives_by_industry[industry].append(executive_id)
+
+    # Returns a description of the first invalid setting, or None if the settings are valid.
+    @staticmethod
+    def check_settings(professionals, executives, operations, base_rate, burst_rate, burst_probability,
+                       calm_probability, reschedule_ratio, cancel_ratio):
+        for name, value in [("professionals", professionals), ("executives", executives),
+                            ("operations", operations)]:
+            if value < 0:
+                return f"{name} must not be negative."
+        for name, value in [("base_rate", base_rate), ("burst_rate", burst_rate)]:
+            if value <= 0:
+                return f"{name} must be positive."
+        for name, value in [("burst_probability", burst_probability), ("calm_probability", calm_probability),
+                            ("reschedule_ratio", reschedule_ratio), ("cancel_ratio", cancel_ratio)]:
+            if not 0 <= value <= 1:
+                return f"{name} must be between 0 and 1."
+        if reschedule_ratio + cancel_ratio >= 1:
+            return "reschedule_ratio + cancel_ratio must be below 1."
+        return None
+
+    # Draws count industry indexes from the Zipf distribution.
+    def draw_industries(self, rng, count):
+        return rng.choices(range(len(self.industries)), cum_weights=self.cumulative_weights, k=count)
+
+    # Yields the Senior Executives, in id order.
+    def generate_executives(self):
+        names, companies, titles = PlatformApp.NAMES, PlatformApp.COMPANIES, PlatformApp.TITLES
+        for i, industry in enumerate(self.executive_industries):
+            industry = self.industries[industry]
+            yield SeniorExecutive(f"{names[i % len(names)]} {i}", industry, companies[i % len(companies)],
+                                  titles[i % len(titles)], (i % 5 + 1) * 50, "Canada", [industry])
+
+    # Yields the Aspiring Professionals, in id order.
+    def generate_professionals(self):
+        names = PlatformApp.NAMES
+        for i, industry in enumerate(self.professional_industries):
+            industry = self.industries[industry]
+            yield AspiringProfessional(f"{names[(i * 7) % len(names)]} {i}", industry, [industry])
+
+    """
+    Yields the operation trace as (timestamp, action, booking_id, professional_id, executive_id, day)
+    tuples. Reschedule and cancel operations refer to a booking created earlier in the trace.
+    """
+    def generate_trace(self):
+        settings = self.settings
+        rng = random.Random(f"{settings['seed']}:trace")
+        professionals = settings["professionals"]
+        executives = settings["executives"]
+        if not professionals or not executives:
+            return
+
+        reschedule_limit = settings["cancel_ratio"] + settings["reschedule_ratio"]
+        active = []
+        owners = {}
+        next_booking = 0
+        timestamp = 0.0
+        bursting = False
+
+        for _ in range(settings["operations"]):
+            if bursting and rng.random() < settings["calm_probability"]:
+                bursting = False
+            elif not bursting and rng.random() < settings["burst_probability"]:
+                bursting = True
+            timestamp += rng.expovariate(settings["burst_rate"] if bursting else settings["base_rate"])
+
+            day = rng.choice(WorkloadGenerator.DAYS)
+            roll = rng.random()
+            if active and roll < reschedule_limit:
+                position = rng.randrange(len(active))
+                booking_id = active[position]
+                professional_id, executive_id = owners[booking_id]
+                if roll < settings["cancel_ratio"]:
+                    # Swap-remove keeps picking an active booking O(1)
+                    active[position] = active[-1]
+                    active.pop()
+                    del owners[booking_id]
+                    yield (timestamp, WorkloadGenerator.CANCEL, booking_id, professional_id, executive_id, day)
+                else:
+                    yield (timestamp, WorkloadGenerator.RESCHEDULE, booking_id, professional_id, executive_id, day)
+                continue
+
+            professional_id = rng.randrange(professionals)
+            candidates = self.executives_by_industry[self.professional_industries[professional_id]]
+            executive_id = rng.choice(candidates) if candidates else rng.randrange(executives)
+            booking_id = next_booking
+            next_booking += 1
+            active.append(booking_id)
+            owners[booking_id] = (professional_id, executive_id)
+            yield (timestamp, WorkloadGenerator.BOOK, booking_id, professional_id, executive_id, day)
+
+    # Writes the settings header and the operation trace to a JSON lines file.
+    def write_trace(self, path):
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(json.dumps(self.settings) + "\n")
+            for operation in self.generate_trace():
+                file.write(json.dumps(operation) + "\n")
+
+    # Returns the generator stored in a trace file header and an iterator over its operations.
+    @staticmethod
+    def read_trace(path):
+        file = open(path, encoding="utf-8")
+        generator = WorkloadGenerator(**json.loads(file.readline()))
+
+        def operations():
+            with file:
+                for line in file:
+                    yield tuple(json.loads(line))
+
+        return generator, operations()
+
+#______________________________________________________________________________________
+
+"""
+    Represents the result of a replay.
+
+    Attributes:
+    - setup_seconds: Time spent loading the entities into the platform.
+    - elapsed: Wall-clock time spent replaying the trace, including reading the streamed trace.
+    - busy_seconds: Time spent inside Platform operations only, excluding trace reading or generation.
+    - operations: Number of operations replayed.
+    - errors: Number of operations that failed.
+    - samples: List of (elapsed, operations, throughput, memory_bytes) tuples taken during the replay.
+    - concurrency: Number of worker threads used.
+    - speed: Pacing factor relative to the trace timestamps, or None for an unthrottled replay.
+    - max_lag: In a paced replay, the longest an operation finished after its scheduled time.
+    - baseline_memory: Memory usage after the entities were loaded, before the replay started.
+"""
+
+class ReplayReport:
+    def __init__(self, setup_seconds, elapsed, busy_seconds, operations, errors, samples, concurrency=1,
+                 speed=None, max_lag=0.0, baseline_memory=None):
+        self.setup_seconds = setup_seconds
+        self.elapsed = elapsed
+        self.busy_seconds = busy_seconds
+        self.operations = operations
+        self.errors = errors
+        self.samples = samples
+        self.concurrency = concurrency
+        self.speed = speed
+        self.max_lag = max_lag
+        self.baseline_memory = baseline_memory
+
+    # Returns the overall throughput in operations per second.
+    def get_throughput(self):
+        return self.operations / self.elapsed if self.elapsed else 0.0
+
+    # Returns the throughput of the Platform operations alone, in operations per second.
+    def get_platform_throughput(self):
+        return self.operations / self.busy_seconds if self.busy_seconds else 0.0
+
+    # Returns the highest memory usage sampled, in bytes.
+    def get_peak_memory(self):
+        return max((sample[3] for sample in self.samples if sample[3] is not None), default=None)
+
+    # Returns a formatted string with the replay results.
+    def display_report(self):
+        info = ""
+        info += f"Setup: {self.setup_seconds:.2f}s\n"
+        if self.speed:
+            info += f"Mode: paced at {self.speed:g}x the trace timestamps (max lag {self.max_lag:.3f}s)\n"
+        else:
+            info += "Mode: unthrottled\n"
+        info += f"Workers: {self.concurrency}"
+        if self.concurrency > 1:
+            info += " sharing one platform lock (measures lock contention, not parallel speedup)"
+        info += "\n"
+        info += f"Replay: {self.operations} operations in {self.elapsed:.2f}s wall clock, including trace reading " \
+                f"({self.get_throughput():.0f} ops/s)\n"
+        info += f"Platform time: {self.busy_seconds:.2f}s ({self.get_platform_throughput():.0f} ops/s)\n"
+        info += f"Errors: {self.errors}\n"
+        info += f"Baseline memory: {ReplayReport.format_bytes(self.baseline_memory)}\n"
+        info += f"Peak memory: {ReplayReport.format_bytes(self.get_peak_memory())} " \
+                f"({self.format_growth(self.get_peak_memory())} above baseline)\n"
+        info += "Elapsed(s)  Operations  Throughput(ops/s)  Memory      Growth\n"
+        for elapsed, operations, throughput, memory in self.samples:
+            info += f"{elapsed:>10.2f}  {operations:>10}  {throughput:>17.0f}  " \
+                    f"{ReplayReport.format_bytes(memory):<10}  {self.format_growth(memory)}\n"
+        return info
+
+    # Returns the memory growth over the baseline as a formatted string.
+    def format_growth(self, memory):
+        if memory is None or self.baseline_memory is None:
+            return "n/a"
+        return ReplayReport.format_bytes(memory - self.baseline_memory)
+
+    @staticmethod
+    def format_bytes(size):
+        if size is None:
+            return "n/a"
+        return f"{size / (1024 * 1024):.1f} MiB"
+
+#______________________________________________________________________________________
+
+"""
+    Replays an operation trace headlessly against a Platform.
+
+    Entities are loaded with a single Platform.batch() and memory is measured once as a
+    baseline. Operations are then streamed from the given iterable through bounded per-worker
+    queues, so the trace is never held in memory. Wall-clock time includes reading the trace;
+    busy_seconds in the report counts only the time spent inside Platform operations.
+
+    By default operations are dispatched as fast as possible. With a speed factor they follow
+    the trace timestamps (speed 2 replays twice as fast as recorded), so bursts in the trace
+    reach the platform as bursts; max_lag in the report shows when the platform falls behind.
+
+    Operations are sharded by Aspiring Professional across `concurrency` worker threads, so
+    the operations of one professional keep their trace order. Platform is not thread-safe,
+    so every operation runs under one shared lock: extra workers measure lock contention and
+    dispatch overhead, not parallel speedup. Throughput and memory are sampled every
+    sample_seconds.
+
+    Attributes:
+    - generator: WorkloadGenerator providing the entities.
+    - concurrency: Number of worker threads.
+    - sample_seconds: Interval between throughput and memory samples.
+    - trace_memory: Whether to measure Python allocations with tracemalloc instead of process RSS.
+    - speed: Pacing factor relative to the trace timestamps, or None to replay unthrottled.
+"""
+
+class ReplayHarness:
+    QUEUE_SIZE = 10000
+
+    def __init__(self, generator, concurrency=1, sample_seconds=1.0, trace_memory=False, speed=None):
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be positive.")
+        self.generator = generator
+        self.concurrency = max(1, concurrency)
+        self.sample_seconds = sample_seconds
+        self.trace_memory = trace_memory
+        self.speed = speed
+        self.platform = None
+        self.professionals = []
+        self.executives = []
+        self.bookings = {}
+        self.lock = threading.Lock()
+        self.completed = 0
+        self.errors = 0
+        self.busy_seconds = 0.0
+        self.max_lag = 0.0
+
+    # Creates a fresh platform and loads every entity with one batch.
+    def setup(self):
+        EventLog().get_events().clear()
+        self.platform = Platform()
+        self.professionals = list(self.generator.generate_professionals())
+        self.executives = list(self.generator.generate_executives())
+        self.bookings = {}
+        with self.platform.batch() as batch:
+            for executive in self.executives:
+                batch.add_senior_executive(executive)
+            for professional in self.professionals:
+                batch.add_aspiring_professional(professional)
+
+    # Applies one trace operation to the platform.
+    def apply(self, operation):
+        _, action, booking_id, professional_id, executive_id, day = operation
+        if action == WorkloadGenerator.BOOK:
+            booking = Booking(self.professionals[professional_id], self.executives[executive_id], day)
+            self.platform.add_booking(booking)
+            self.bookings[booking_id] = booking
+        elif action == WorkloadGenerator.RESCHEDULE:
+            self.bookings[booking_id].set_day(day)
+        elif action == WorkloadGenerator.CANCEL:
+            booking = self.bookings.pop(booking_id)
+            self.platform.remove_booking(booking)
+            booking.get_aspiring_professional().decrease_frequency()
+        else:
+            raise ValueError(f"Unknown operation: {action}")
+
+    # Applies the (due, operation) pairs of one shard until it receives None.
+    def work(self, operations):
+        while True:
+            item = operations.get()
+            if item is None:
+                return
+            due, operation = item
+            with self.lock:
+                start = time.perf_counter()
+                try:
+                    self.apply(operation)
+                except Exception:
+                    self.errors += 1
+                finished = time.perf_counter()
+                self.busy_seconds += finished - start
+                self.completed += 1
+                if due is not None:
+                    self.max_lag = max(self.max_lag, finished - due)
+
+    # Returns the current memory usage in bytes, or None if it cannot be measured. Process RSS
+    # is read from /proc (Linux); elsewhere use trace_memory.
+    def memory_usage(self):
+        if self.trace_memory:
+            return tracemalloc.get_traced_memory()[0]
+        try:
+            with open("/proc/self/statm") as statm:
+                return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError, AttributeError):
+            return None
+
+    # Records throughput and memory samples until stopped.
+    def sample(self, start, samples, stopped):
+        last_time, last_completed = start, 0
+        while not stopped.wait(self.sample_seconds):
+            now, completed = time.perf_counter(), self.completed
+            throughput = (completed - last_completed) / (now - last_time)
+            samples.append((now - start, completed, throughput, self.memory_usage()))
+            last_time, last_completed = now, completed
+
+    # Loads the entities, replays the operations and returns a ReplayReport.
+    def replay(self, operations):
+        if self.trace_memory:
+            tracemalloc.start()
+        try:
+            setup_start = time.perf_counter()
+            self.setup()
+            setup_seconds = time.perf_counter() - setup_start
+            baseline_memory = self.memory_usage()
+
+            self.completed = 0
+            self.errors = 0
+            self.busy_seconds = 0.0
+            self.max_lag = 0.0
+            shards = [queue.Queue(ReplayHarness.QUEUE_SIZE) for _ in range(self.concurrency)]
+            workers = [threading.Thread(target=self.work, args=(shard,), daemon=True) for shard in shards]
+            samples = []
+            stopped = threading.Event()
+
+            start = time.perf_counter()
+            sampler = threading.Thread(target=self.sample, args=(start, samples, stopped), daemon=True)
+            sampler.start()
+            for worker in workers:
+                worker.start()
+            # Operations are streamed through the bounded shard queues, so the trace is never
+            # held in memory and the memory samples reflect the platform
+            for operation in operations:
+                due = None
+                if self.speed:
+                    due = start + operation[0] / self.speed
+                    delay = due - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                shards[operation[3] % self.concurrency].put((due, operation))
+            for shard in shards:
+                shard.put(None)
+            for worker in workers:
+                worker.join()
+            elapsed = time.perf_counter() - start
+            stopped.set()
+            sampler.join()
+
+            samples.append((elapsed, self.completed, self.completed / elapsed if elapsed else 0.0,
+                            self.memory_usage()))
+            return ReplayReport(setup_seconds, elapsed, self.busy_seconds, self.completed, self.errors, samples,
+                                self.concurrency, self.speed, self.max_lag, baseline_memory)
+        finally:
+            if self.trace_memory:
+                tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate and replay synthetic platform workloads.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    generate = commands.add_parser("generate", help="Write a seeded operation trace.")
+    generate.add_argument("trace")
+    generate.add_argument("--seed", type=int, default=0)
+    generate.add_argument("--professionals", type=int, default=1000)
+    generate.add_argument("--executives", type=int, default=100)
+    generate.add_argument("--operations", type=int, default=10000)
+    generate.add_argument("--industry-skew", type=float, default=1.1)
+    generate.add_argument("--base-rate", type=float, default=10.0)
+    generate.add_argument("--burst-rate", type=float, default=200.0)
+    generate.add_argument("--burst-probability", type=float, default=0.01)
+    generate.add_argument("--calm-probability", type=float, default=0.1)
+    generate.add_argument("--reschedule-ratio", type=float, default=0.2)
+    generate.add_argument("--cancel-ratio", type=float, default=0.1)
+
+    replay = commands.add_parser("replay", help="Replay a trace against a fresh Platform.")
+    replay.add_argument("trace")
+    replay.add_argument("--concurrency", type=int, default=1,
+                        help="worker threads; they share one platform lock, so more workers measure lock "
+                             "contention, not parallel speedup")
+    replay.add_argument("--speed", type=float, default=None,
+                        help="follow the trace timestamps at this speed factor (e.g. 10 = ten times faster "
+                             "than recorded); omit to replay unthrottled")
+    replay.add_argument("--sample-seconds", type=float, default=1.0)
+    replay.add_argument("--trace-memory", action="store_true",
+                        help="measure Python allocations with tracemalloc (slower) instead of process RSS, "
+                             "which is only available on Linux")
+
+    args = vars(parser.parse_args())
+    command = args.pop("command")
+    if command == "generate":
+        trace = args.pop("trace")
+        error = WorkloadGenerator.check_settings(
+            args["professionals"], args["executives"], args["operations"], args["base_rate"], args["burst_rate"],
+            args["burst_probability"], args["calm_probability"], args["reschedule_ratio"], args["cancel_ratio"],
+        )
+        if error:
+            parser.error(error.replace("_", "-"))
+        WorkloadGenerator(**args).write_trace(trace)
+        print(f"Trace written to {trace}.")
+    else:
+        if args["concurrency"] < 1:
+            parser.error("concurrency must be at least 1.")
+        if args["speed"] is not None and args["speed"] <= 0:
+            parser.error("speed must be positive.")
+        if args["sample_seconds"] <= 0:
+            parser.error("sample-seconds must be positive.")
+        generator, operations = WorkloadGenerator.read_trace(args["trace"])
+        harness = ReplayHarness(generator, args["concurrency"], args["sample_seconds"], args["trace_memory"],
+                                args["speed"])
+        print(harness.replay(operations).display_report())
+
+
+if __name__ == "__main__":
+    main()